@@ -0,0 +1,58 @@
+"""
+Small on-disk cache for Spotify responses, shared across CLI invocations.
+
+Responses are pickled under the user cache directory and keyed on the
+wrapped function name and its arguments, trading a local read for an
+HTTPS round-trip on repeated pipelines.
+"""
+
+import hashlib
+import os
+import pickle
+import time
+from functools import wraps
+from typing import Any, Callable
+
+CACHE_DIR = os.path.join(
+    os.getenv("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "powerspot"
+)
+
+
+def _path(key: str) -> str:
+    return os.path.join(CACHE_DIR, hashlib.sha1(key.encode()).hexdigest() + ".pkl")
+
+
+def cached(ttl: float = 3600) -> Callable:
+    """Decorator caching the function result on disk for ttl seconds."""
+
+    def real_decorator(function: Callable) -> Callable:
+        @wraps(function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = repr((function.__name__, args, sorted(kwargs.items())))
+            path = _path(key)
+            try:
+                if time.time() - os.path.getmtime(path) < ttl:
+                    with open(path, "rb") as file_content:
+                        return pickle.load(file_content)
+            except (OSError, pickle.PickleError):
+                pass
+            result = function(*args, **kwargs)
+            # None means the call failed (e.g. no token), don't cache it
+            if result is not None:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                with open(path, "wb") as file_content:
+                    pickle.dump(result, file_content)
+            return result
+
+        return wrapper
+
+    return real_decorator
+
+
+def clear() -> None:
+    """Removes all cached responses."""
+    if not os.path.isdir(CACHE_DIR):
+        return
+    for filename in os.listdir(CACHE_DIR):
+        if filename.endswith(".pkl"):
+            os.remove(os.path.join(CACHE_DIR, filename))
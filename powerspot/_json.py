@@ -0,0 +1,32 @@
+"""
+JSON helpers using orjson when available, falling back to the stdlib.
+
+orjson parses and serializes large Spotify payloads several times faster
+than the stdlib json module. Both backends expose the same interface
+here: `loads` accepts str or bytes, `dumps` always returns bytes.
+"""
+
+from typing import Any, Union
+
+try:
+    import orjson
+
+    def loads(data: Union[str, bytes]) -> Any:
+        """Deserializes a JSON document from a string or bytes."""
+        return orjson.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        """Serializes an object to JSON bytes."""
+        return orjson.dumps(obj)
+
+
+except ImportError:
+    import json
+
+    def loads(data: Union[str, bytes]) -> Any:
+        """Deserializes a JSON document from a string or bytes."""
+        return json.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        """Serializes an object to JSON bytes."""
+        return json.dumps(obj).encode()
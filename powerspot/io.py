@@ -3,11 +3,85 @@ Input and output functions to store, parse and export Spotify data.
 """
 
 import datetime
-from typing import Any, Dict, Iterable, Optional
+import re
+from operator import itemgetter
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Sequence, Tuple
 
-from tabulate import tabulate
+from powerspot import _json
 
-DATE_FORMAT = "%Y-%m-%d"
+# C-level field extraction for the hot formatting paths
+_name = itemgetter("name")
+_artists = itemgetter("artists")
+_release_date = itemgetter("release_date")
+_album = itemgetter("album")
+
+
+def _album_row(album: Dict[str, Any]) -> Tuple[str, str, str]:
+    """Extracts the (artist, album, date) row from an album."""
+    return (_artists(album)[0]["name"], _name(album), _release_date(album))
+
+
+def _track_row(track: Dict[str, Any]) -> Tuple[str, str, str]:
+    """Extracts the (artist, track, album) row from a track."""
+    return (_artists(track)[0]["name"], _name(track), _album(track)["name"])
+
+
+# large buffer to coalesce reads and writes of multi-MB exports
+BUFFER_SIZE = 128 * 1024
+
+# lists shorter than this are serialized in one shot
+STREAM_THRESHOLD = 1000
+
+
+# short string fields repeated across items in large dumps
+_DEDUP_FIELDS = ("type", "album_type", "release_date", "release_date_precision")
+
+
+def _dedup_strings(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Deduplicates repeated short string fields of parsed JSON items.
+
+    A library dump materializes the same dates, types and artist names
+    thousands of times; sharing one copy cuts allocations and improves
+    locality for the later formatting passes.
+    """
+    cache = {}  # type: Dict[str, str]
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        for field in _DEDUP_FIELDS:
+            value = item.get(field)
+            if isinstance(value, str):
+                item[field] = cache.setdefault(value, value)
+        for artist in item.get("artists", ()):
+            name = artist.get("name")
+            if isinstance(name, str):
+                artist["name"] = cache.setdefault(name, name)
+    return items
+
+
+def read_json(filename: str) -> Any:
+    """Reads and deserializes JSON content from the file."""
+    with open(filename, "rb", buffering=BUFFER_SIZE) as file_content:
+        content = _json.loads(file_content.read())
+    if isinstance(content, list):
+        _dedup_strings(content)
+    return content
+
+
+def dump_json_stream(obj: Any, fp: BinaryIO) -> None:
+    """Serializes an object to JSON and writes it to a binary file.
+    Long top-level lists are written element by element so only one
+    element is serialized in memory at a time.
+    """
+    if not isinstance(obj, list) or len(obj) < STREAM_THRESHOLD:
+        fp.write(_json.dumps(obj))
+        return
+    fp.write(b"[")
+    for index, element in enumerate(obj):
+        if index:
+            fp.write(b",")
+        fp.write(_json.dumps(element))
+    fp.write(b"]")
 
 
 def parse_artists(
@@ -16,76 +90,93 @@ def parse_artists(
     """Parses artists from JSON format to a readable string.
     Optionally write the current date at beginning of string.
     """
-    output = output_date(print_date)
-    artists = (artist["name"] for artist in artists_json)
-    for artist in artists:
-        output += f"- {artist}\n"
-    return output
+    lines = [f"- {artist['name']}\n" for artist in artists_json]
+    return output_date(print_date) + "".join(lines)
 
 
 def parse_albums(albums_json: Iterable[Dict[str, Any]], print_date: bool = True) -> str:
     """Parses albums from JSON format to a readable string.
     Optionally write the current date at beginning of string.
     """
-    output = output_date(print_date)
-    albums = (album["name"] for album in albums_json)
-    artists = (album["artists"][0]["name"] for album in albums_json)
-    dates = (album["release_date"] for album in albums_json)
-    for artist, album, date in zip(artists, albums, dates):
-        output += f"- {artist} - {album} - {date}\n"
-    return output
+    lines = [
+        f"- {artist} - {album} - {date}\n"
+        for artist, album, date in map(_album_row, albums_json)
+    ]
+    return output_date(print_date) + "".join(lines)
+
+
+def _tabulate3(rows: Iterable[Tuple[str, str, str]], headers: Sequence[str]) -> str:
+    """Formats rows of three strings as an aligned table."""
+    rows = list(rows)
+    widths = [
+        max(len(header), max((len(row[i]) for row in rows), default=0))
+        for i, header in enumerate(headers)
+    ]
+    lines = [
+        f"{headers[0]:<{widths[0]}}  {headers[1]:<{widths[1]}}  {headers[2]}",
+        f"{'-' * widths[0]}  {'-' * widths[1]}  {'-' * widths[2]}",
+    ]
+    lines.extend(
+        f"{row[0]:<{widths[0]}}  {row[1]:<{widths[1]}}  {row[2]}" for row in rows
+    )
+    return "\n".join(lines)
 
 
 def tabulate_albums(
     albums_json: Iterable[Dict[str, Any]], print_date: bool = True
 ) -> str:
-    """Parses albums from JSON format to a string table using tabulate.
+    """Parses albums from JSON format to a string table.
     Optionally write the current date at beginning of string.
     """
     output = output_date(print_date)
-    albums = (
-        (album["artists"][0]["name"], album["name"], album["release_date"])
-        for album in albums_json
+    output += _tabulate3(
+        map(_album_row, albums_json), headers=["Artist", "Album", "Date"]
     )
-    output += tabulate(albums, headers=["Artist", "Album", "Date"])
     return output
 
 
 def tabulate_tracks(
     tracks_json: Iterable[Dict[str, Any]], print_date: bool = True
 ) -> str:
-    """Parses tracks from JSON format to a string table using tabulate.
+    """Parses tracks from JSON format to a string table.
     Optionally write the current date at beginning of string.
     """
     output = output_date(print_date)
-    tracks = (
-        (track["artists"][0]["name"], track["name"], track["album"]["name"])
-        for track in tracks_json
+    output += _tabulate3(
+        map(_track_row, tracks_json), headers=["Artist", "Track", "Album"]
     )
-    output += tabulate(tracks, headers=["Artist", "Track", "Album"])
     return output
 
 
+_today = None  # type: Optional[str]
+
+
 def output_date(print_date: bool = True) -> str:
-    if print_date:
-        return f"%date {datetime.datetime.now().strftime(DATE_FORMAT)}\n"
-    return ""
+    global _today
+    if not print_date:
+        return ""
+    # the date only changes once a day, format it a single time
+    if _today is None:
+        _today = f"%date {datetime.date.today().isoformat()}\n"
+    return _today
+
+
+_DATE_RE = re.compile(r"%date\s+(\S+)")
 
 
 def read_date(filename: str) -> Optional[datetime.datetime]:
-    """Reads and returns the date metadata contained in the file.
+    """Reads and returns the date metadata on the first line of the file.
     Returns None if date could not be found or read.
     """
-    with open(filename, "r") as file_content:
-        while True:
-            words = file_content.readline().split()
-            if words[0][1:] == "date":
-                date_str = words[1]
-                break
-    try:
-        return datetime.datetime.strptime(date_str, DATE_FORMAT)
-    except NameError:
+    # only the first line is read, a small buffer avoids pulling in
+    # the rest of the file
+    with open(filename, "r", buffering=4096) as file_content:
+        match = _DATE_RE.match(file_content.readline())
+    if match is None:
         print("Date could not be found")
+        return None
+    try:
+        return datetime.datetime.fromisoformat(match.group(1))
     except ValueError:
         print("Date format is invalid")
     return None
@@ -3,15 +3,65 @@ Functions that access the Spotify account to retrieve data or modify
 the user library
 """
 
+from __future__ import annotations
+
 import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 from inspect import signature
-from typing import Any, Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 import click
-from spotipy import Spotify
-from spotipy.oauth2 import SpotifyClientCredentials
-from spotipy.util import prompt_for_user_token
+
+from powerspot import _cache
+
+# spotipy pulls in requests and oauthlib; import it only when a
+# function actually hits the API so CLI startup stays fast
+if TYPE_CHECKING:
+    from spotipy import Spotify
+
+# Spotify access tokens are valid for one hour
+TOKEN_LIFETIME = 3600
+
+_client: Optional[Spotify] = None
+
+_scoped_clients: Dict[Tuple[str, str], Tuple[Spotify, float]] = {}
+
+
+def _get_client() -> Spotify:
+    """Returns the shared client-credentials Spotify client.
+
+    The credentials manager refreshes its own token, so one client can
+    serve every token-less operation and keep its connections alive.
+    """
+    global _client
+    if _client is None:
+        from spotipy import Spotify
+        from spotipy.oauth2 import SpotifyClientCredentials
+
+        _client = Spotify(client_credentials_manager=SpotifyClientCredentials())
+    return _client
+
+
+def _get_scoped_client(username: str, scope: str) -> Optional[Spotify]:
+    """Returns a Spotify client authenticated for the scope.
+
+    Clients are cached per (username, scope) so chained CLI commands
+    don't repeat the OAuth round-trip, and refreshed near expiry.
+    """
+    from spotipy import Spotify
+    from spotipy.util import prompt_for_user_token
+
+    cached = _scoped_clients.get((username, scope))
+    if cached is not None and time.time() < cached[1] - 60:
+        return cached[0]
+    token = prompt_for_user_token(username, scope)
+    if not token:
+        return None
+    sp = Spotify(auth=token)
+    _scoped_clients[(username, scope)] = (sp, time.time() + TOKEN_LIFETIME)
+    return sp
 
 
 def operation(function: Callable) -> Callable:
@@ -19,9 +69,7 @@ def operation(function: Callable) -> Callable:
 
     @wraps(function)
     def wrapper(*args: Any, **kwargs: Any) -> Callable:
-        credentials = SpotifyClientCredentials()
-        sp = Spotify(client_credentials_manager=credentials)
-        return function(sp, *args, **kwargs)
+        return function(_get_client(), *args, **kwargs)
 
     return wrapper
 
@@ -35,9 +83,8 @@ def scope_operation(scope: str) -> Callable:
     def real_decorator(function: Callable) -> Callable:
         @wraps(function)
         def wrapper(username: str, *args: Any, **kwargs: Any) -> None:
-            token = prompt_for_user_token(username, scope)
-            if token:
-                sp = Spotify(auth=token)
+            sp = _get_scoped_client(username, scope)
+            if sp is not None:
                 if "user" in signature(function).parameters:
                     return function(sp, *args, user=username, **kwargs)
                 return function(sp, *args, **kwargs)
@@ -51,13 +98,23 @@ def scope_operation(scope: str) -> Callable:
     return real_decorator
 
 
+# latest album per (artist id, album type, country), so repeated release
+# scans in one process don't refetch the same artists
+_latest_albums: Dict[Tuple[str, str, str], Optional[Dict[str, Any]]] = {}
+
+
 def parse_release_date(date: str) -> datetime.datetime:
-    """Parses the release date in a datetime object."""
-    try:
-        output = datetime.datetime.strptime(date, "%Y-%m-%d")
-    except ValueError:
-        output = datetime.datetime.strptime(date, "%Y")
-    return output
+    """Parses the release date in a datetime object.
+
+    Release dates come as 'YYYY-MM-DD', 'YYYY-MM' or 'YYYY' depending
+    on the release_date_precision; dispatching on the length picks the
+    right constructor without raising and catching ValueError.
+    """
+    if len(date) == 4:
+        return datetime.datetime(int(date), 1, 1)
+    if len(date) == 7:
+        return datetime.datetime(int(date[:4]), int(date[5:7]), 1)
+    return datetime.datetime.fromisoformat(date)
 
 
 @operation
@@ -134,15 +191,25 @@ def search_artist(sp: Spotify, artist: str, limit: int = 5) -> List[Dict[str, An
     return sp.search(query, limit=limit, type="artist")["artists"]
 
 
+@_cache.cached(ttl=3600)
 @scope_operation("user-follow-read")
 def get_followed_artists(sp: Spotify) -> List[Dict[str, Any]]:
-    """Returns the full list of followed artists"""
+    """Returns the full list of followed artists
+
+    The next page is fetched in the background while the current one is
+    consumed, overlapping the paging round-trips.
+    """
     artists = []  # type: List[Dict[str, Any]]
-    results = sp.current_user_followed_artists(limit=50)["artists"]
-    artists.extend(results["items"])
-    while results["next"]:
-        results = sp.next(results)["artists"]
-        artists.extend(results["items"])
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        results = sp.current_user_followed_artists(limit=50)["artists"]
+        while True:
+            future = executor.submit(sp.next, results) if results["next"] else None
+            artists.extend(results["items"])
+            if future is None:
+                break
+            results = future.result()["artists"]
+    # guard against duplicates across page boundaries
+    artists = list({artist["id"]: artist for artist in artists}.values())
     artists.sort(key=lambda artist: artist["name"].lower())
     return artists
 
@@ -155,28 +222,42 @@ def get_new_releases(
     weeks: int = 4,
     album_type: str = "album",
     country: str = "FR",
+    workers: int = 16,
 ) -> List[Dict[str, Any]]:
     """Returns a list of released albums from the given artists
-    since the a given date (first choice) or during a given interval"""
+    since the a given date (first choice) or during a given interval
+
+    Artist lookups run in a thread pool, the calls being network-bound.
+    """
     if date is None:
         date = datetime.datetime.now() - datetime.timedelta(weeks=weeks)
-    new_releases = []
-    click.echo(f"Fetching from {date.strftime('%Y-%m-%d')}")
-    with click.progressbar(artists, label="Fetching new releases") as progress_bar:
-        for artist in progress_bar:
+    click.echo(f"Fetching from {date.date().isoformat()}")
+
+    def last_album(artist: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        key = (artist["id"], album_type, country)
+        if key not in _latest_albums:
             results = sp.artist_albums(
                 artist["id"], album_type=album_type, country=country, limit=1
             )["items"]
-            if len(results) == 0:
-                continue
-            # only get last album
-            album = results[0]
-            release_date = parse_release_date(album["release_date"])
-            if release_date > date:
-                new_releases.append(album)
+            _latest_albums[key] = results[0] if results else None
+        return _latest_albums[key]
+
+    new_releases = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        albums = executor.map(last_album, artists)
+        with click.progressbar(
+            albums, length=len(artists), label="Fetching new releases"
+        ) as progress_bar:
+            for album in progress_bar:
+                if album is None:
+                    continue
+                release_date = parse_release_date(album["release_date"])
+                if release_date > date:
+                    new_releases.append(album)
     return new_releases
 
 
+@_cache.cached(ttl=3600)
 @scope_operation("user-library-read")
 def get_saved_albums(sp: Spotify) -> List[Dict[str, Any]]:
     """Returns the list of albums saved in user library"""
@@ -189,6 +270,7 @@ def get_saved_albums(sp: Spotify) -> List[Dict[str, Any]]:
     return albums
 
 
+@_cache.cached(ttl=3600)
 @scope_operation("user-library-read")
 def get_saved_tracks(sp: Spotify) -> List[Dict[str, Any]]:
     """Returns the list of tracks saved in user library"""
@@ -204,11 +286,18 @@ def get_saved_tracks(sp: Spotify) -> List[Dict[str, Any]]:
 @scope_operation("user-library-modify")
 def save_albums(sp: Spotify, albums: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Saves the albums in the user library"""
+    # the endpoint accepts at most 50 ids per call
     ids = [album["id"] for album in albums]
-    results = sp.current_user_saved_albums_add(ids)
+    chunks = [ids[start:start + 50] for start in range(0, len(ids), 50)]
+    # small pool to stay well within rate limits
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(sp.current_user_saved_albums_add, chunks))
+    # the library changed, cached responses are stale
+    _cache.clear()
     return results
 
 
+@_cache.cached(ttl=3600)
 @scope_operation("user-top-read")
 def get_top_artists(
     sp: Spotify, time_range: str = "long_term", limit: int = 20
@@ -218,6 +307,7 @@ def get_top_artists(
     return results
 
 
+@_cache.cached(ttl=3600)
 @scope_operation("user-top-read")
 def get_top_tracks(
     sp: Spotify, time_range: str = "long_term", limit: int = 20
@@ -2,8 +2,8 @@
 Helpers for CLI appearence and UI.
 """
 
-from functools import update_wrapper
-from typing import Any, Callable
+from contextlib import contextmanager
+from typing import Iterator
 
 import click
 
@@ -17,16 +17,9 @@ GREET = r"""
 """
 
 
-def echo_feedback(before: str, after: str) -> Callable:
-    """Decorators to echo messages before and after calling a function."""
-
-    def pass_obj(function: Callable) -> Callable:
-        @click.pass_context
-        def wrapper(ctx: click.Context, *args: Any, **kwargs: Any) -> None:
-            click.echo(click.style(before, fg="cyan"))
-            ctx.invoke(function, *args, **kwargs)
-            click.echo(click.style(f"{after}\n", fg="blue", bold=True))
-
-        return update_wrapper(wrapper, function)
-
-    return pass_obj
+@contextmanager
+def feedback(before: str, after: str) -> Iterator[None]:
+    """Context manager to echo messages before and after a block."""
+    click.echo(click.style(before, fg="cyan"))
+    yield
+    click.echo(click.style(f"{after}\n", fg="blue", bold=True))
@@ -1,2 +0,0 @@
-from setuptools import setup
-setup()